@@ -9,11 +9,56 @@ Date: June 2025
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 from datetime import datetime
+from importlib.util import find_spec
 import sys
 
+# pyarrow is optional: it speeds up CSV reading and is required for Parquet/Feather files
+HAVE_PYARROW = find_spec('pyarrow') is not None
+
+# Suffixes stored as uncompressed Arrow IPC (Feather v2) files
+FEATHER_SUFFIXES = ('.arrow', '.feather')
+
+# CSV files larger than this are read in chunks of CSV_CHUNK_ROWS rows to bound peak memory
+LARGE_CSV_BYTES = 256 * 1024 * 1024
+CSV_CHUNK_ROWS = 1_000_000
+
+# Amounts are held in memory as int64 paise and converted to rupees only for display and storage
+PAISE_PER_RUPEE = 100
+# Paise values must stay below this to fit in int64
+MAX_PAISE = 2 ** 63
+
+
+def _to_paise(rupees):
+    """
+    Convert a Series of rupee amounts to int64 paise.
+    
+    Raises:
+        ValueError: If any amount is missing, not a number or too large to store
+    """
+    paise = (rupees * PAISE_PER_RUPEE).round()
+    # NaN fails this comparison too, so missing amounts are caught as well
+    invalid = ~(paise.abs() < MAX_PAISE).to_numpy()
+    if invalid.any():
+        bad_rows = np.flatnonzero(invalid) + 1
+        shown = ', '.join(str(row) for row in bad_rows[:5]) + (', ...' if len(bad_rows) > 5 else '')
+        raise ValueError(f"Amount is missing or out of range in {len(bad_rows)} expense(s) (data row {shown})")
+    return paise.astype('int64')
+
+def _ensure_dates(df):
+    """
+    Make sure the Date column was parsed. read_csv(parse_dates=...) quietly leaves the
+    column as strings when a value can't be parsed, so convert it explicitly; this raises
+    on bad dates instead of failing later in the menus.
+    
+    Returns:
+        pd.DataFrame: The same frame with Date as datetime
+    """
+    if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
 class ExpenseTracker:
     """
     A comprehensive expense tracking application with data analysis and visualization capabilities.
@@ -21,33 +66,114 @@ class ExpenseTracker:
     
     def __init__(self, csv_file='expenses.csv'):
         """
-        Initialize the ExpenseTracker with a CSV file.
+        Initialize the ExpenseTracker with a CSV, Parquet or Feather file.
         
         Args:
-            csv_file (str): Path to the CSV file containing expense data
+            csv_file (str): Path to the file containing expense data; a .parquet
+                suffix selects Parquet storage, .arrow or .feather selects Feather,
+                anything else is read as CSV
         """
         self.csv_file = csv_file
-        self.df = None
+        self._df = None
+        # Aggregations over self.df, reused until the data changes
+        self._cache = {}
+        self._dirty = True
+        # New expenses not yet in the DataFrame; appended in one batch the next time it is read
+        self._pending = []
         self.load_data()
     
+    @property
+    def df(self):
+        """
+        The expense DataFrame, including any expenses added since it was last read.
+        """
+        if self._pending:
+            self._flush_pending()
+        return self._df
+    
+    @df.setter
+    def df(self, value):
+        self._df = value
+    
     def load_data(self):
         """
-        Load expense data from CSV file. Create a new file if it doesn't exist.
+        Load expense data from CSV, Parquet or Feather file. Create a new file if it doesn't exist.
         """
         try:
+            # Buffered expenses have already been written to the file being reloaded
+            self._pending.clear()
             if os.path.exists(self.csv_file):
-                self.df = pd.read_csv(self.csv_file)
-                # Convert Date column to datetime
-                self.df['Date'] = pd.to_datetime(self.df['Date'])
+                if self.csv_file.endswith(FEATHER_SUFFIXES):
+                    # Memory-map the uncompressed Arrow file so reloads are served from the page cache
+                    from pyarrow import feather
+                    self.df = feather.read_table(self.csv_file, memory_map=True).to_pandas()
+                elif self.csv_file.endswith('.parquet'):
+                    # Parquet stores typed columns, so nothing needs re-parsing
+                    self.df = pd.read_parquet(self.csv_file, engine='pyarrow')
+                elif os.path.getsize(self.csv_file) > LARGE_CSV_BYTES:
+                    self.df = self._read_csv_in_chunks()
+                else:
+                    self.df = self._read_csv()
+                self._compact_columns()
                 print(f"Successfully loaded {len(self.df)} expenses from {self.csv_file}")
             else:
                 # Create sample data if file doesn't exist
                 print(f"⚠ {self.csv_file} not found. Creating sample data...")
                 self.create_sample_data()
+            self._dirty = True
         except Exception as e:
             print(f"Error loading data: {e}")
             sys.exit(1)
     
+    def _compact_columns(self):
+        """
+        Convert freshly loaded data to its in-memory layout: Category as categorical
+        codes and Amount as int64 paise.
+        """
+        # Few distinct categories: store them as integer codes for fast grouping
+        self.df['Category'] = self.df['Category'].astype('category')
+        self.df['Amount'] = _to_paise(self.df['Amount'])
+    
+    def _read_csv(self):
+        """
+        Read the CSV with Date and Amount typed while parsing, using pyarrow's
+        multithreaded reader when it is installed.
+        
+        Returns:
+            pd.DataFrame: The loaded expense data
+        """
+        if HAVE_PYARROW:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+            options = pa_csv.ConvertOptions(column_types={'Date': pa.timestamp('s'), 'Amount': pa.float64()})
+            try:
+                return pa_csv.read_csv(self.csv_file, convert_options=options).to_pandas()
+            except pa.ArrowInvalid:
+                # Dates not in YYYY-MM-DD form; fall back to pandas' more lenient parsing
+                pass
+        return _ensure_dates(pd.read_csv(self.csv_file, parse_dates=['Date'], dtype={'Amount': 'float64'}))
+    
+    def _read_csv_in_chunks(self):
+        """
+        Read a large CSV chunk by chunk, storing each chunk's categories as integer codes
+        so the full file is never held as Python strings at once.
+        
+        Returns:
+            pd.DataFrame: The loaded expense data
+        """
+        # Each chunk infers its own date format, so each one is checked
+        chunks = [_ensure_dates(chunk) for chunk in
+                  pd.read_csv(self.csv_file, chunksize=CSV_CHUNK_ROWS, parse_dates=['Date'],
+                              dtype={'Amount': 'float64', 'Category': 'category'})]
+        
+        # Give every chunk the same, alphabetically sorted categories (matching astype('category'))
+        # so concat keeps the categorical dtype and reports stay in category order
+        categories = pd.api.types.union_categoricals([chunk['Category'] for chunk in chunks],
+                                                     sort_categories=True).categories
+        for chunk in chunks:
+            chunk['Category'] = chunk['Category'].cat.set_categories(categories)
+        return pd.concat(chunks, ignore_index=True)
+    
     def create_sample_data(self):
         """
         Create sample expense data for demonstration purposes.
@@ -64,19 +190,162 @@ class ExpenseTracker:
         
         self.df = pd.DataFrame(sample_data)
         self.df['Date'] = pd.to_datetime(self.df['Date'])
+        self._compact_columns()
         self.save_data()
         print(f"Created sample data with {len(self.df)} entries")
     
     def save_data(self):
         """
-        Save the current DataFrame to CSV file.
+        Save the current DataFrame to CSV, Parquet or Feather file.
+        """
+        try:
+            self._flush_pending()
+            # Files keep amounts in rupees
+            out_df = self.df.assign(Amount=self.df['Amount'] / PAISE_PER_RUPEE)
+            if self.csv_file.endswith(FEATHER_SUFFIXES):
+                # The loaded frame may still reference the memory-mapped file, so
+                # write a new file and swap it in rather than truncating in place
+                tmp_file = self.csv_file + '.tmp'
+                out_df.to_feather(tmp_file, compression='uncompressed')
+                os.replace(tmp_file, self.csv_file)
+            elif self.csv_file.endswith('.parquet'):
+                out_df.to_parquet(self.csv_file, engine='pyarrow', compression='zstd', index=False)
+            else:
+                out_df.to_csv(self.csv_file, index=False, date_format='%Y-%m-%d')
+            print(f"Data saved to {self.csv_file}")
+        except Exception as e:
+            print(f"Error saving data: {e}")
+    
+    def _save_new_expense(self, expense):
+        """
+        Persist a newly added expense. CSV files get just the new row appended, so neither
+        the file nor the DataFrame is rebuilt per addition; other formats are saved in full.
+        
+        Args:
+            expense (dict): The new expense with its amount in rupees
         """
+        if (self.csv_file.endswith(FEATHER_SUFFIXES + ('.parquet',))
+                or not os.path.exists(self.csv_file) or os.path.getsize(self.csv_file) == 0):
+            self.save_data()
+            return
+        
         try:
-            self.df.to_csv(self.csv_file, index=False, date_format='%Y-%m-%d')
+            # Match the file's column order and start on a fresh line
+            columns = pd.read_csv(self.csv_file, nrows=0).columns
+            with open(self.csv_file, 'a+b') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+            pd.DataFrame([expense], columns=columns).to_csv(
+                self.csv_file, mode='a', header=False, index=False, date_format='%Y-%m-%d')
             print(f"Data saved to {self.csv_file}")
         except Exception as e:
             print(f"Error saving data: {e}")
     
+    def _flush_pending(self):
+        """
+        Append buffered new expenses to the DataFrame with a single concat.
+        """
+        if self._pending:
+            new_rows = pd.DataFrame.from_records(self._pending)
+            new_rows['Amount'] = _to_paise(new_rows['Amount'])
+            self._pending.clear()
+            df = pd.concat([self._df, new_rows], ignore_index=True)
+            # concat falls back to object dtype when the categories differ
+            df['Category'] = df['Category'].astype('category')
+            self._df = df
+            self._dirty = True
+    
+    def _valid_cache(self):
+        """
+        Return the aggregation cache, emptying it first if the data changed since it was filled.
+        """
+        self._flush_pending()
+        if self._dirty:
+            self._cache.clear()
+            self._dirty = False
+        return self._cache
+    
+    def _numeric_columns(self):
+        """
+        Return the Amount and Date columns as plain NumPy arrays, extracted once per data
+        change so hot paths can index them directly instead of going through pandas.
+        Category and Description are left in pandas; turning them into object arrays would
+        cost far more than the few rows ever read from them at once.
+        
+        Returns:
+            dict: 'Amount' and 'Date' mapped to their NumPy arrays
+        """
+        cache = self._valid_cache()
+        if 'numeric_columns' not in cache:
+            cache['numeric_columns'] = {name: self.df[name].to_numpy() for name in ('Amount', 'Date')}
+        return cache['numeric_columns']
+    
+    def _category_totals(self):
+        """
+        Return the total amount per category, recomputing it only after the data changes.
+        
+        Returns:
+            pd.Series: Total amount in paise indexed by category
+        """
+        cache = self._valid_cache()
+        if 'cat' not in cache:
+            grouped = self.df.groupby('Category', observed=True, sort=False)['Amount']
+            cache['cat'] = grouped.sum()
+            cache['count'] = grouped.size()
+            cache['total'] = self.df['Amount'].sum()
+        return cache['cat']
+    
+    def _category_counts(self):
+        """
+        Return the number of transactions per category, cached alongside the category totals.
+        """
+        self._category_totals()
+        return self._cache['count']
+    
+    def _total_amount(self):
+        """
+        Return the total amount in paise across all expenses, cached alongside the category totals.
+        """
+        self._category_totals()
+        return self._cache['total']
+    
+    def _date_order(self):
+        """
+        Return row positions ordered by date (oldest first) and the dates in that order,
+        recomputing them only after the data changes.
+        
+        Returns:
+            tuple: (positions, sorted_dates) as NumPy arrays
+        """
+        cache = self._valid_cache()
+        if 'date_order' not in cache:
+            dates = self._numeric_columns()['Date']
+            order = np.argsort(dates, kind='stable')
+            cache['date_order'] = order
+            cache['sorted_dates'] = dates[order]
+        return cache['date_order'], cache['sorted_dates']
+    
+    def _print_expense_rows(self, positions, description_width):
+        """
+        Print one formatted line per expense with a single write to stdout.
+        
+        Args:
+            positions (np.ndarray): Non-empty row positions to print, in display order
+            description_width (int): Column width for the description
+        """
+        columns = self._numeric_columns()
+        # Format every date in one vectorized call rather than per row
+        dates = np.datetime_as_string(columns['Date'][positions], unit='D')
+        amounts = columns['Amount'][positions] / PAISE_PER_RUPEE
+        categories = self.df['Category'].array.take(positions)
+        descriptions = self.df['Description'].array.take(positions)
+        lines = [
+            f"{date:<12} {category:<15} ₹{amount:>8,.2f} {description:<{description_width}}"
+            for date, category, amount, description in zip(dates, categories, amounts, descriptions)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     def display_total_overview(self):
         """
         Display comprehensive spending overview including totals and extremes.
@@ -89,30 +358,37 @@ class ExpenseTracker:
             print("No expenses found.")
             return
         
-        # Calculate totals
-        total_amount = self.df['Amount'].sum()
-        total_transactions = len(self.df)
-        average_expense = self.df['Amount'].mean()
+        # Calculate totals and extremes directly on the raw Amount array
+        columns = self._numeric_columns()
+        amounts = columns['Amount']
+        total_paise = amounts.sum()
+        lowest_pos = amounts.argmin()
+        highest_pos = amounts.argmax()
+        total_amount = total_paise / PAISE_PER_RUPEE
+        total_transactions = amounts.size
+        average_expense = total_amount / total_transactions
         
         print(f"Total Amount Spent: ₹{total_amount:,.2f}")
         print(f"Total Transactions: {total_transactions}")
         print(f"Average Expense: ₹{average_expense:,.2f}")
         
-        # Find highest and lowest expenses
-        highest_idx = self.df['Amount'].idxmax()
-        lowest_idx = self.df['Amount'].idxmin()
+        # Read the other fields at just these two positions; converting the whole
+        # Category/Description columns to object arrays would dominate the cost
+        dates = columns['Date']
+        categories = self.df['Category'].array
+        descriptions = self.df['Description'].array
         
         print(f"\n HIGHEST EXPENSE:")
-        print(f"   Date: {self.df.loc[highest_idx, 'Date'].strftime('%Y-%m-%d')}")
-        print(f"   Category: {self.df.loc[highest_idx, 'Category']}")
-        print(f"   Amount: ₹{self.df.loc[highest_idx, 'Amount']:,.2f}")
-        print(f"   Description: {self.df.loc[highest_idx, 'Description']}")
+        print(f"   Date: {pd.Timestamp(dates[highest_pos]).strftime('%Y-%m-%d')}")
+        print(f"   Category: {categories[highest_pos]}")
+        print(f"   Amount: ₹{amounts[highest_pos] / PAISE_PER_RUPEE:,.2f}")
+        print(f"   Description: {descriptions[highest_pos]}")
         
         print(f"\n LOWEST EXPENSE:")
-        print(f"   Date: {self.df.loc[lowest_idx, 'Date'].strftime('%Y-%m-%d')}")
-        print(f"   Category: {self.df.loc[lowest_idx, 'Category']}")
-        print(f"   Amount: ₹{self.df.loc[lowest_idx, 'Amount']:,.2f}")
-        print(f"   Description: {self.df.loc[lowest_idx, 'Description']}")
+        print(f"   Date: {pd.Timestamp(dates[lowest_pos]).strftime('%Y-%m-%d')}")
+        print(f"   Category: {categories[lowest_pos]}")
+        print(f"   Amount: ₹{amounts[lowest_pos] / PAISE_PER_RUPEE:,.2f}")
+        print(f"   Description: {descriptions[lowest_pos]}")
     
     def category_analysis(self):
         """
@@ -126,17 +402,18 @@ class ExpenseTracker:
             print("No expenses found for analysis.")
             return
         
-        # Group by category and calculate statistics
-        category_stats = self.df.groupby('Category').agg({
-            'Amount': ['sum', 'count', 'mean'],
-            'Description': 'count'
+        # Derive per-category statistics from one sum/size pass over Amount
+        totals = self._category_totals() / PAISE_PER_RUPEE
+        counts = self._category_counts()
+        category_stats = pd.DataFrame({
+            'Total_Amount': totals,
+            'Transaction_Count': counts,
+            'Average_Amount': totals / counts,
+            'Description_Count': counts
         }).round(2)
         
-        # Flatten column names
-        category_stats.columns = ['Total_Amount', 'Transaction_Count', 'Average_Amount', 'Description_Count']
-        
         # Calculate percentage of total spending
-        total_spending = self.df['Amount'].sum()
+        total_spending = self._total_amount() / PAISE_PER_RUPEE
         category_stats['Percentage'] = (category_stats['Total_Amount'] / total_spending * 100).round(2)
         
         # Sort by total amount (descending)
@@ -159,8 +436,11 @@ class ExpenseTracker:
             print("No data available for pie chart.")
             return
         
+        # Imported here so startup doesn't pay for matplotlib unless a chart is drawn
+        import matplotlib.pyplot as plt
+        
         # Group by category and sum amounts
-        category_totals = self.df.groupby('Category')['Amount'].sum().sort_values(ascending=False)
+        category_totals = self._category_totals().sort_values(ascending=False) / PAISE_PER_RUPEE
         
         # Create pie chart
         plt.figure(figsize=(10, 8))
@@ -211,30 +491,34 @@ class ExpenseTracker:
             start_dt = pd.to_datetime(start_date)
             end_dt = pd.to_datetime(end_date)
             
-            # Filter dataframe
-            mask = (self.df['Date'] >= start_dt) & (self.df['Date'] <= end_dt)
-            filtered_df = self.df.loc[mask]
+            # Filter dataframe with two binary searches over the sorted dates
+            order, sorted_dates = self._date_order()
+            start = start_dt.to_datetime64().astype(sorted_dates.dtype)
+            end = end_dt.to_datetime64().astype(sorted_dates.dtype)
+            lo = np.searchsorted(sorted_dates, start, side='left')
+            hi = np.searchsorted(sorted_dates, end, side='right')
+            positions = order[lo:hi]
+            filtered_df = self.df.take(positions)
             
             if filtered_df.empty:
                 print(f"No expenses found between {start_date} and {end_date}")
                 return
             
             print(f"\n✓ Found {len(filtered_df)} expenses between {start_date} and {end_date}")
-            print(f"Total Amount: ₹{filtered_df['Amount'].sum():,.2f}")
+            print(f"Total Amount: ₹{filtered_df['Amount'].sum() / PAISE_PER_RUPEE:,.2f}")
             
             # Display filtered data
             print(f"\n{'Date':<12} {'Category':<15} {'Amount':<10} {'Description':<30}")
             print("-" * 70)
             
-            for _, row in filtered_df.iterrows():
-                print(f"{row['Date'].strftime('%Y-%m-%d'):<12} {row['Category']:<15} "
-                      f"₹{row['Amount']:>8,.2f} {row['Description']:<30}")
+            self._print_expense_rows(positions, description_width=30)
             
             # Perform analysis on filtered data
             print(f"\n Category Analysis for {start_date} to {end_date}:")
             if len(filtered_df) > 0:
-                category_totals = filtered_df.groupby('Category')['Amount'].sum().sort_values(ascending=False)
-                total = filtered_df['Amount'].sum()
+                grouped = filtered_df.groupby('Category', observed=True, sort=False)['Amount']
+                category_totals = grouped.sum().sort_values(ascending=False) / PAISE_PER_RUPEE
+                total = filtered_df['Amount'].sum() / PAISE_PER_RUPEE
                 
                 for category, amount in category_totals.items():
                     percentage = (amount / total * 100)
@@ -268,8 +552,9 @@ class ExpenseTracker:
                 print("Category and description cannot be empty.")
                 return
             
-            if amount <= 0:
-                print("Amount must be positive.")
+            # Also rejects nan/inf and amounts too large to store in paise
+            if not 0 < amount * PAISE_PER_RUPEE < MAX_PAISE:
+                print("Amount must be a positive number within range.")
                 return
             
             # Create new expense entry
@@ -280,12 +565,11 @@ class ExpenseTracker:
                 'Description': description
             }
             
-            # Add to dataframe
-            new_row = pd.DataFrame([new_expense])
-            self.df = pd.concat([self.df, new_row], ignore_index=True)
+            # Buffer the row; it is appended to the dataframe the next time the data is read
+            self._pending.append(new_expense)
             
-            # Save to CSV
-            self.save_data()
+            # Save to file
+            self._save_new_expense(new_expense)
             
             print(f"   Successfully added expense:")
             print(f"   Date: {date}")
@@ -298,28 +582,58 @@ class ExpenseTracker:
         except Exception as e:
             print(f"Error adding expense: {e}")
     
+    def _summary_by_category(self):
+        """
+        Compute the per-category figures for the summary report, using a single
+        pyarrow hash aggregation when pyarrow is installed.
+        
+        Returns:
+            pd.DataFrame: Total, count and average amount (in paise) and first/last
+                date per category, sorted by category
+        """
+        columns = ['Total_Amount', 'Transaction_Count', 'Average_Amount', 'First_Date', 'Last_Date']
+        
+        if HAVE_PYARROW:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            table = pa.Table.from_pandas(self.df[['Category', 'Amount', 'Date']], preserve_index=False)
+            # group_by keeps a null-key group; pandas groupby drops it, so match that
+            table = table.filter(pc.is_valid(table['Category']))
+            result = table.group_by('Category').aggregate([
+                ('Amount', 'sum'), ('Amount', 'count'), ('Amount', 'mean'),
+                ('Date', 'min'), ('Date', 'max')
+            ]).to_pandas().set_index('Category')
+            category_stats = result[['Amount_sum', 'Amount_count', 'Amount_mean', 'Date_min', 'Date_max']]
+            category_stats.columns = columns
+            return category_stats.sort_index()
+        
+        category_stats = self.df.groupby('Category', observed=True).agg({
+            'Amount': ['sum', 'count', 'mean'],
+            'Date': ['min', 'max']
+        })
+        category_stats.columns = columns
+        return category_stats
+    
     def export_summary_report(self):
         """
         Export category analysis to a CSV summary report.
         """
         try:
-            category_stats = self.df.groupby('Category').agg({
-                'Amount': ['sum', 'count', 'mean'],
-                'Date': ['min', 'max']
-            }).round(2)
+            category_stats = self._summary_by_category()
             
-            # Flatten column names
-            category_stats.columns = ['Total_Amount', 'Transaction_Count', 'Average_Amount', 'First_Date', 'Last_Date']
+            # Report amounts in rupees
+            category_stats['Total_Amount'] = (category_stats['Total_Amount'] / PAISE_PER_RUPEE).round(2)
+            category_stats['Average_Amount'] = (category_stats['Average_Amount'] / PAISE_PER_RUPEE).round(2)
             
             # Calculate percentage
-            total_spending = self.df['Amount'].sum()
+            total_spending = self._total_amount() / PAISE_PER_RUPEE
             category_stats['Percentage'] = (category_stats['Total_Amount'] / total_spending * 100).round(2)
             
             # Add summary statistics
             summary_stats = pd.DataFrame({
                 'Total_Amount': [total_spending],
                 'Transaction_Count': [len(self.df)],
-                'Average_Amount': [self.df['Amount'].mean()],
+                'Average_Amount': [self.df['Amount'].mean() / PAISE_PER_RUPEE],
                 'First_Date': [self.df['Date'].min()],
                 'Last_Date': [self.df['Date'].max()],
                 'Percentage': [100.0]
@@ -370,17 +684,15 @@ class ExpenseTracker:
             print("No expenses found.")
             return
         
-        # Sort by date (newest first)
-        sorted_df = self.df.sort_values('Date', ascending=False)
+        # Sort by date (newest first) using the cached date order
+        order, _ = self._date_order()
         
         print(f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description':<40}")
         print("-" * 80)
         
-        for _, row in sorted_df.iterrows():
-            print(f"{row['Date'].strftime('%Y-%m-%d'):<12} {row['Category']:<15} "
-                  f"₹{row['Amount']:>8,.2f} {row['Description']:<40}")
+        self._print_expense_rows(order[::-1], description_width=40)
         
-        print(f"\nTotal Expenses: {len(sorted_df)} | Total Amount: ₹{sorted_df['Amount'].sum():,.2f}")
+        print(f"\nTotal Expenses: {len(order)} | Total Amount: ₹{self._total_amount() / PAISE_PER_RUPEE:,.2f}")
     
     def run(self):
         """
@@ -389,33 +701,40 @@ class ExpenseTracker:
         print("Welcome to the Expense Tracker!")
         print("Manage your finances with ease using Python, Pandas & NumPy")
         
+        # Menu choices mapped straight to their handlers
+        actions = {
+            '1': self.display_total_overview,
+            '2': self.category_analysis,
+            '3': self.create_pie_chart,
+            '4': self.filter_by_date,
+            '5': self.add_new_expense,
+            '6': self.export_summary_report,
+            '7': self.load_data,
+            '8': self.view_all_expenses
+        }
+        
+        # prompt_toolkit adds history and line editing on interactive terminals
+        if sys.stdin.isatty() and find_spec('prompt_toolkit'):
+            from prompt_toolkit import PromptSession
+            read_choice = PromptSession().prompt
+        else:
+            read_choice = input
+        
         while True:
             self.display_menu()
             
             try:
-                choice = input("Enter your choice (1-9): ").strip()
+                choice = read_choice("Enter your choice (1-9): ").strip()
                 
-                if choice == '1':
-                    self.display_total_overview()
-                elif choice == '2':
-                    self.category_analysis()
-                elif choice == '3':
-                    self.create_pie_chart()
-                elif choice == '4':
-                    self.filter_by_date()
-                elif choice == '5':
-                    self.add_new_expense()
-                elif choice == '6':
-                    self.export_summary_report()
-                elif choice == '7':
-                    self.load_data()
-                elif choice == '8':
-                    self.view_all_expenses()
-                elif choice == '9':
+                if choice == '9':
                     print("Thank you for using Expense Tracker! Stay financially healthy!")
                     break
-                else:
+                
+                action = actions.get(choice)
+                if action is None:
                     print("Invalid choice. Please select 1-9.")
+                else:
+                    action()
                 
                 # Wait for user input before continuing
                 if choice in ['1', '2', '4', '6', '8']:
@@ -433,8 +752,8 @@ def main():
     Main function to run the expense tracker application.
     """
     try:
-        # Create and run the expense tracker
-        tracker = ExpenseTracker()
+        # Create and run the expense tracker, optionally on a file given on the command line
+        tracker = ExpenseTracker(sys.argv[1]) if len(sys.argv) > 1 else ExpenseTracker()
         tracker.run()
     except Exception as e:
         print(f"Fatal error: {e}")